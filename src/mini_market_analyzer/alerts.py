@@ -0,0 +1,223 @@
+import json
+import time
+import urllib.request
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+import pandas as pd
+from rich.console import Console
+
+from mini_market_analyzer.indicators import add_indicators
+from mini_market_analyzer.strategy import AnalysisResult, analyze_market
+
+console = Console()
+
+# EMA 200 needs a few hundred bars to settle, older history is dropped.
+DEFAULT_MAX_BARS = 500
+MIN_HISTORY_BARS = 200
+DEFAULT_COOLDOWN = 300.0
+
+
+@dataclass
+class AlertEvent:
+    ticker: str
+    kind: str  # "signal" or "regime"
+    previous: str
+    current: str
+    price: float
+    confidence: float
+    timestamp: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class AlertSink(Protocol):
+    def emit(self, event: AlertEvent) -> None: ...
+
+
+class StdoutSink:
+    """Prints transition events to the terminal."""
+
+    def emit(self, event: AlertEvent) -> None:
+        console.print(
+            f"[bold]{event.ticker}[/bold] {event.kind}: "
+            f"{event.previous} -> [cyan]{event.current}[/cyan] "
+            f"(${event.price:.2f}, confidence {event.confidence:.0%})"
+        )
+
+
+class JsonlSink:
+    """Appends one JSON object per event to a file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def emit(self, event: AlertEvent) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(event.to_dict()) + "\n")
+
+
+class WebhookSink:
+    """POSTs each event as JSON to a webhook URL."""
+
+    def __init__(self, url: str, timeout: float = 5.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    def emit(self, event: AlertEvent) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(event.to_dict()).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except Exception as e:
+            # A flaky endpoint must not stop the monitoring loop
+            console.print(f"[yellow]Warning: Webhook delivery failed: {e}[/yellow]")
+
+
+class AlertEngine:
+    """
+    Tracks the last Signal and MarketRegime per ticker and emits an event
+    whenever `analyze_market` flips one of them.
+
+    Bars are pushed per ticker with `push`; only tickers whose bars actually
+    changed are re-evaluated by the next `run_cycle`, so the work per cycle
+    scales with the number of updated tickers rather than the universe size.
+
+    Events are always relative to the last value sent to the sinks, per
+    (ticker, kind):
+    - Cooldown: no event within `cooldown` seconds of the last emitted one.
+      A change that arrives during the cooldown is kept pending and emitted
+      once the cooldown expires, if it still differs from the last value.
+    - Dedupe: a flap that returns to the last emitted value before the
+      cooldown expires produces no event.
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[AlertSink],
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_bars: int = DEFAULT_MAX_BARS,
+        prepare: Callable[[pd.DataFrame], pd.DataFrame] = add_indicators,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.sinks = list(sinks)
+        self.cooldown = cooldown
+        self.max_bars = max_bars
+        self.prepare = prepare
+        self.clock = clock
+
+        self._bars: dict[str, pd.DataFrame] = {}
+        self._results: dict[str, AnalysisResult] = {}
+        self._reported: dict[tuple[str, str], tuple[str, float]] = {}
+        self._dirty: set[str] = set()
+        self._deferred: set[str] = set()
+
+    @property
+    def pending(self) -> set[str]:
+        """Tickers that will be re-evaluated on the next cycle."""
+        return set(self._dirty)
+
+    def push(self, ticker: str, bars: pd.DataFrame) -> bool:
+        """
+        Merges new (or revised) bars for a ticker.
+
+        Returns:
+            bool: True if the stored bars changed and the ticker was queued.
+        """
+        if bars.empty:
+            return False
+
+        existing = self._bars.get(ticker)
+        if existing is None:
+            merged = bars
+        else:
+            merged = pd.concat([existing, bars])
+            merged = merged[~merged.index.duplicated(keep="last")]
+        merged = merged.sort_index().iloc[-self.max_bars :]
+
+        if existing is not None and merged.equals(existing):
+            return False
+
+        self._bars[ticker] = merged
+        self._dirty.add(ticker)
+        return True
+
+    def run_cycle(self) -> list[AlertEvent]:
+        """
+        Re-evaluates queued tickers and dispatches transition events.
+
+        A ticker that fails to evaluate is reported and skipped; the rest of
+        the queue is still processed.
+        """
+        dirty, self._dirty = self._dirty, set()
+        candidates, self._deferred = self._deferred, set()
+
+        for ticker in sorted(dirty):
+            try:
+                df = self.prepare(self._bars[ticker])
+                self._results[ticker] = analyze_market(df, ticker)
+            except Exception as e:
+                console.print(f"[yellow]Warning: {ticker}: {e}[/yellow]")
+                continue
+            candidates.add(ticker)
+
+        now = self.clock()
+        events: list[AlertEvent] = []
+        for ticker in sorted(candidates):
+            events.extend(self._transitions(ticker, now))
+
+        for event in events:
+            for sink in self.sinks:
+                try:
+                    sink.emit(event)
+                except Exception as e:
+                    # One broken sink must not stop the others or the loop
+                    console.print(
+                        f"[yellow]Warning: Failed to deliver alert: {e}[/yellow]"
+                    )
+
+        return events
+
+    def _transitions(self, ticker: str, now: float) -> list[AlertEvent]:
+        result = self._results[ticker]
+        current = {"regime": result.regime.value, "signal": result.signal.value}
+        events: list[AlertEvent] = []
+
+        for kind, value in current.items():
+            reported = self._reported.get((ticker, kind))
+
+            # The first evaluation only establishes a baseline
+            if reported is None:
+                self._reported[(ticker, kind)] = (value, float("-inf"))
+                continue
+
+            reported_value, reported_at = reported
+            if value == reported_value:
+                continue
+            if now - reported_at < self.cooldown:
+                # Re-checked on later cycles until the cooldown expires
+                self._deferred.add(ticker)
+                continue
+
+            self._reported[(ticker, kind)] = (value, now)
+            events.append(
+                AlertEvent(
+                    ticker=ticker,
+                    kind=kind,
+                    previous=reported_value,
+                    current=value,
+                    price=float(result.current_price),
+                    confidence=result.confidence,
+                    timestamp=now,
+                )
+            )
+
+        return events
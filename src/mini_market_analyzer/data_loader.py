@@ -48,3 +48,86 @@ def fetch_data(ticker: str, period: str = "1y", interval: str = "1d") -> pd.Data
         if isinstance(e, ValueError):
             raise e
         raise ConnectionError(f"Failed to fetch data for '{ticker}': {e!s}") from e
+
+
+# Shortest yfinance period that still yields 200+ bars (enough for EMA 200)
+# at each interval, within Yahoo's intraday history limits.
+LOOKBACK_PERIODS = {
+    "1m": "5d",
+    "2m": "1mo",
+    "5m": "1mo",
+    "15m": "1mo",
+    "30m": "3mo",
+    "60m": "3mo",
+    "90m": "6mo",
+    "1h": "3mo",
+    "1d": "2y",
+    "5d": "10y",
+    "1wk": "10y",
+    "1mo": "max",
+    "3mo": "max",
+}
+
+
+def lookback_period(interval: str) -> str:
+    """
+    Returns a download period long enough for the indicators at `interval`.
+
+    Raises:
+        ValueError: If the interval is not supported by yfinance.
+    """
+    if interval not in LOOKBACK_PERIODS:
+        raise ValueError(
+            f"Unsupported interval '{interval}'. "
+            f"Use one of: {', '.join(LOOKBACK_PERIODS)}"
+        )
+    return LOOKBACK_PERIODS[interval]
+
+
+def fetch_many(
+    tickers: list[str], period: str = "1y", interval: str = "1d"
+) -> dict[str, pd.DataFrame]:
+    """
+    Fetches several tickers with a single yfinance request.
+
+    Tickers that return no data or lack OHLCV columns are left out of the
+    result instead of failing the whole batch.
+
+    Returns:
+        dict[str, pd.DataFrame]: Ticker -> DataFrame in the `fetch_data` format.
+
+    Raises:
+        ConnectionError: If there is an issue fetching data.
+    """
+    try:
+        df = yf.download(
+            tickers,
+            period=period,
+            interval=interval,
+            progress=False,
+            auto_adjust=True,
+            group_by="ticker",
+        )
+    except Exception as e:
+        raise ConnectionError(f"Failed to fetch data for {tickers}: {e!s}") from e
+
+    if df is None or df.empty:
+        return {}
+
+    required_cols = ["open", "high", "low", "close", "volume"]
+    frames: dict[str, pd.DataFrame] = {}
+    for ticker in tickers:
+        if isinstance(df.columns, pd.MultiIndex):
+            if ticker not in df.columns.get_level_values(0):
+                continue
+            frame = df[ticker].dropna(how="all")
+        elif len(tickers) == 1:
+            frame = df.dropna(how="all")
+        else:
+            continue
+
+        frame.columns = [str(c).lower() for c in frame.columns]
+        if not frame.empty and all(col in frame.columns for col in required_cols):
+            frames[ticker] = frame
+
+    return frames
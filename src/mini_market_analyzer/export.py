@@ -0,0 +1,264 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import asdict, fields
+from enum import Enum
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+import pandas as pd
+
+from mini_market_analyzer.indicators import indicator_columns
+from mini_market_analyzer.ingest import OHLCV_COLUMNS
+from mini_market_analyzer.strategy import AnalysisResult
+
+FORMATS = ("jsonl", "parquet", "arrow")
+DEFAULT_BATCH_SIZE = 1000
+
+_EXTENSIONS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def infer_format(path: str | Path) -> str:
+    """Picks an output format from the file extension."""
+    suffix = Path(path).suffix.lower()
+    if suffix not in _EXTENSIONS:
+        raise ValueError(
+            f"Cannot infer output format from '{path}'. "
+            f"Use one of: {', '.join(_EXTENSIONS)}"
+        )
+    return _EXTENSIONS[suffix]
+
+
+def result_to_record(result: AnalysisResult) -> dict[str, Any]:
+    """Flattens an AnalysisResult into plain str/float values."""
+    record = asdict(result)
+    for key, value in record.items():
+        if isinstance(value, Enum):
+            record[key] = value.value
+        elif key != "ticker":
+            record[key] = float(value)
+    return record
+
+
+def frame_to_table(ticker: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turns an indicator frame into long rows keyed by ticker and timestamp.
+
+    Timestamps are converted to UTC (naive ones are taken as UTC), so daily
+    and intraday frames share one column type.
+    """
+    table = df.reset_index()
+    table = table.rename(columns={table.columns[0]: "timestamp"})
+    timestamps = pd.to_datetime(table["timestamp"])
+    if timestamps.dt.tz is None:
+        table["timestamp"] = timestamps.dt.tz_localize("UTC")
+    else:
+        table["timestamp"] = timestamps.dt.tz_convert("UTC")
+    table.insert(0, "ticker", ticker)
+    return table
+
+
+def result_columns() -> dict[str, str]:
+    """Output schema for `result_to_record` rows."""
+    return {
+        f.name: "float" if f.type is float else "string" for f in fields(AnalysisResult)
+    }
+
+
+def frame_columns() -> dict[str, str]:
+    """
+    Output schema for `frame_to_table` rows: OHLCV plus every column
+    `add_indicators` can produce. Indicators missing from a frame (e.g. EMA
+    200 on a short history) are written as nulls.
+    """
+    columns = {"ticker": "string", "timestamp": "timestamp"}
+    for name in [*OHLCV_COLUMNS, *indicator_columns()]:
+        columns[name] = "float"
+    return columns
+
+
+class TableWriter(ABC):
+    """
+    Streams rows with a fixed set of columns to a file in batches.
+
+    Records and frames are buffered and written every `batch_size` rows, so
+    each write becomes one Parquet row group / Arrow record batch. Columns
+    missing from a batch are written as nulls; columns not in the schema
+    raise a ValueError instead of being dropped.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: Mapping[str, str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.path = Path(path)
+        self.columns = dict(columns)
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._records: list[dict[str, Any]] = []
+        self._frames: list[pd.DataFrame] = []
+        self._buffered = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._records.append(record)
+        self._buffered += 1
+        if self._buffered >= self.batch_size:
+            self.flush()
+
+    def write_frame(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        self._stash_records()
+        self._frames.append(self._conform(df))
+        self._buffered += len(df)
+        if self._buffered >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self._stash_records()
+        if not self._frames:
+            return
+        batch = pd.concat(self._frames, ignore_index=True)
+        self._write_frame(batch)
+        self.rows_written += len(batch)
+        self._frames = []
+        self._buffered = 0
+
+    def close(self) -> None:
+        self.flush()
+
+    def _stash_records(self) -> None:
+        if self._records:
+            self._frames.append(self._conform(pd.DataFrame.from_records(self._records)))
+            self._records = []
+
+    def _conform(self, df: pd.DataFrame) -> pd.DataFrame:
+        unknown = [c for c in df.columns if c not in self.columns]
+        if unknown:
+            raise ValueError(f"Columns not in the output schema: {unknown}")
+        return df.reindex(columns=list(self.columns))
+
+    @abstractmethod
+    def _write_frame(self, df: pd.DataFrame) -> None:
+        """Writes one batch whose columns already match the schema."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class JsonlWriter(TableWriter):
+    """One JSON object per line, timestamps in ISO 8601."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: Mapping[str, str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        super().__init__(path, columns, batch_size)
+        self._file = self.path.open("w", encoding="utf-8")
+
+    def _write_frame(self, df: pd.DataFrame) -> None:
+        text = df.to_json(orient="records", lines=True, date_format="iso")
+        self._file.write(text if text.endswith("\n") else text + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+
+class ArrowWriter(TableWriter):
+    """
+    Parquet or Arrow IPC (Feather v2) output via pyarrow.
+
+    The file is created with the full schema up front, so it exists and is
+    readable by any Arrow/Parquet reader even if no rows are written.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: Mapping[str, str],
+        fmt: str = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for Parquet/Arrow output. "
+                "Install it with `uv sync --extra export`."
+            ) from e
+
+        super().__init__(path, columns, batch_size)
+        self.fmt = fmt
+        self._pa = pa
+
+        types = {
+            "string": pa.string(),
+            "float": pa.float64(),
+            "timestamp": pa.timestamp("ns", tz="UTC"),
+        }
+        self._schema = pa.schema(
+            [(name, types[kind]) for name, kind in self.columns.items()]
+        )
+        self._writer = self._open()
+
+    def _open(self) -> Any:
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq  # noqa: PLC0415
+
+            return pq.ParquetWriter(self.path, self._schema)
+        return self._pa.ipc.new_file(self.path, self._schema)
+
+    def _write_frame(self, df: pd.DataFrame) -> None:
+        table = self._pa.Table.from_pandas(
+            df, schema=self._schema, preserve_index=False
+        )
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
+
+
+def open_writer(
+    path: str | Path,
+    columns: Mapping[str, str],
+    fmt: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> TableWriter:
+    """
+    Opens a streaming writer for `path`.
+
+    Args:
+        path: Output file.
+        columns: Column name -> "string", "float" or "timestamp", e.g.
+            `result_columns()` or `frame_columns()`.
+        fmt: "jsonl", "parquet" or "arrow"; inferred from the extension if None.
+        batch_size: Rows buffered before each write (one row group per flush).
+    """
+    fmt = fmt or infer_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}'. Use one of: {FORMATS}")
+    if fmt == "jsonl":
+        return JsonlWriter(path, columns, batch_size)
+    return ArrowWriter(path, columns, fmt, batch_size)
@@ -1,3 +1,5 @@
+from functools import cache
+
 import pandas as pd
 import pandas_ta as ta  # noqa: F401
 
@@ -30,3 +32,26 @@ def add_indicators(df: pd.DataFrame) -> pd.DataFrame:
     df_analyzed.ta.atr(length=14, append=True)
 
     return df_analyzed
+
+
+@cache
+def indicator_columns() -> tuple[str, ...]:
+    """
+    Names of the columns `add_indicators` appends, in order.
+
+    pandas-ta decides the exact names (e.g. the Bollinger Band suffix differs
+    between releases) and omits indicators when the history is too short, so
+    they are read from a run over enough synthetic data to produce all of them.
+    """
+    n = 300
+    close = pd.Series([100.0 + (i % 7) for i in range(n)])
+    sample = pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": 1000.0,
+        }
+    )
+    return tuple(c for c in add_indicators(sample).columns if c not in sample.columns)
@@ -0,0 +1,166 @@
+import sys
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+BAR_AGG = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+DEFAULT_CHUNKSIZE = 500_000
+
+
+@dataclass
+class IngestStats:
+    rows: int = 0
+    bars: int = 0
+    seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def _peak_rss_mb() -> float:
+    # The resource module only exists on Unix
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return 0.0
+
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def _to_bars(chunk: pd.DataFrame, timestamps: pd.Series, interval: str) -> pd.DataFrame:
+    """Aggregates one chunk of ticks or finer bars into OHLCV bars."""
+    if all(col in chunk.columns for col in ["open", "high", "low", "close"]):
+        frame = chunk[["open", "high", "low", "close"]].copy()
+        frame["volume"] = chunk["volume"] if "volume" in chunk.columns else 0.0
+    elif "price" in chunk.columns:
+        price = chunk["price"]
+        size = chunk["size"] if "size" in chunk.columns else chunk.get("volume", 0.0)
+        frame = pd.DataFrame(
+            {"open": price, "high": price, "low": price, "close": price, "volume": size}
+        )
+    else:
+        raise ValueError(
+            "Expected either open/high/low/close columns or a price column."
+        )
+
+    buckets = timestamps.dt.floor(interval)
+    bars = frame.groupby(buckets.to_numpy()).agg(BAR_AGG)
+    bars.index.name = timestamps.name
+    return bars
+
+
+def iter_bars(
+    path: str | Path,
+    interval: str = "1min",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    timestamp_col: str = "timestamp",
+    stats: IngestStats | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams a tick or bar CSV in chunks and yields completed OHLCV bars.
+
+    The file must be in chronological order. The last bar of each chunk may
+    continue in the next one, so it is carried over and merged before being
+    emitted. Memory is bounded by the chunk size, not the file size.
+
+    Timestamps with UTC offsets (e.g. local exchange time across DST changes)
+    are converted to UTC; naive timestamps are taken as UTC. Bars are bucketed
+    and labeled in UTC, with a naive index.
+
+    Args:
+        path: CSV file with a timestamp column and either `price` (and
+            optionally `size`/`volume`) or `open`/`high`/`low`/`close`.
+        interval: Bar size as a pandas offset alias (e.g., "1min", "5min", "1D").
+        chunksize: Number of CSV rows to read per chunk.
+        timestamp_col: Name of the timestamp column (case-insensitive).
+        stats: Optional IngestStats updated in place while streaming.
+
+    Yields:
+        pd.DataFrame: Bars with lowercase OHLCV columns, as `fetch_data` returns.
+    """
+    stats = stats if stats is not None else IngestStats()
+    timestamp_col = timestamp_col.lower()
+    wanted = {timestamp_col, "price", "size", *OHLCV_COLUMNS}
+    start = time.perf_counter()
+    carry: pd.DataFrame | None = None
+    last_seen: pd.Timestamp | None = None
+
+    reader = pd.read_csv(
+        path, chunksize=chunksize, usecols=lambda c: c.strip().lower() in wanted
+    )
+    for chunk in reader:
+        chunk.columns = [c.strip().lower() for c in chunk.columns]
+        if timestamp_col not in chunk.columns:
+            raise ValueError(f"Missing required columns: {[timestamp_col]}")
+        if chunk.empty:
+            continue
+        stats.rows += len(chunk)
+
+        # Offsets may change mid-file (DST), so everything is moved to UTC
+        timestamps = pd.to_datetime(chunk[timestamp_col], utc=True).dt.tz_localize(None)
+        if not timestamps.is_monotonic_increasing or (
+            last_seen is not None and timestamps.iloc[0] < last_seen
+        ):
+            raise ValueError(
+                f"'{path}' is not in chronological order "
+                f"(around row {stats.rows - len(chunk) + 1})."
+            )
+        last_seen = timestamps.iloc[-1]
+
+        bars = _to_bars(chunk, timestamps, interval)
+        if carry is not None:
+            bars = pd.concat([carry, bars]).groupby(level=0, sort=False).agg(BAR_AGG)
+
+        carry = bars.iloc[-1:]
+        complete = bars.iloc[:-1]
+        if not complete.empty:
+            stats.bars += len(complete)
+            yield complete
+
+    if carry is not None and not carry.empty:
+        stats.bars += len(carry)
+        yield carry
+
+    stats.seconds = time.perf_counter() - start
+    stats.peak_rss_mb = _peak_rss_mb()
+
+
+def ingest(
+    path: str | Path,
+    interval: str = "1min",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    timestamp_col: str = "timestamp",
+) -> tuple[pd.DataFrame, IngestStats]:
+    """
+    Reads a large tick or bar CSV into a single OHLCV DataFrame.
+
+    The result can be passed straight to `add_indicators` and `analyze_market`.
+
+    Returns:
+        tuple[pd.DataFrame, IngestStats]: The bars and throughput statistics.
+
+    Raises:
+        ValueError: If the file has no rows, lacks price columns or is not
+            in chronological order.
+    """
+    stats = IngestStats()
+    parts = list(iter_bars(path, interval, chunksize, timestamp_col, stats))
+    if not parts:
+        raise ValueError(f"No data found in '{path}'.")
+
+    return pd.concat(parts), stats
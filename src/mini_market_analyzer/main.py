@@ -1,5 +1,10 @@
+import time
 from collections.abc import Iterable
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Annotated
 
+import numpy as np
 import pandas as pd
 import plotext as plt
 import typer
@@ -13,10 +18,32 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from mini_market_analyzer.data_loader import fetch_data
+from mini_market_analyzer.alerts import (
+    MIN_HISTORY_BARS,
+    AlertEngine,
+    AlertSink,
+    JsonlSink,
+    StdoutSink,
+    WebhookSink,
+)
+from mini_market_analyzer.data_loader import fetch_data, fetch_many, lookback_period
+from mini_market_analyzer.export import (
+    DEFAULT_BATCH_SIZE,
+    frame_columns,
+    frame_to_table,
+    open_writer,
+    result_columns,
+    result_to_record,
+)
 from mini_market_analyzer.gemini_analyzer import GeminiAnalyzer
 from mini_market_analyzer.indicators import add_indicators
+from mini_market_analyzer.ingest import DEFAULT_CHUNKSIZE, ingest
 from mini_market_analyzer.strategy import Signal, analyze_market
+from mini_market_analyzer.universe import (
+    RollingCorrelation,
+    UniverseReport,
+    analyze_universe,
+)
 
 # Load environment variables
 load_dotenv()
@@ -203,6 +230,237 @@ def chart(ticker: str, period: str = "1y") -> None:
         console.print(f"[bold red]Error:[/bold red] {e}")
 
 
+@app.command()
+def scan(
+    tickers: list[str],
+    output: Annotated[str, typer.Option(help="Results file (.jsonl/.parquet/.arrow)")],
+    period: str = "1y",
+    frames: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """
+    Analyze many tickers and stream results to a JSONL, Parquet or Arrow file.
+
+    The format is taken from the file extension. With --frames, the full
+    indicator frame of every ticker is written to a second file as well.
+    """
+    try:
+        results = open_writer(output, result_columns(), batch_size=batch_size)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    try:
+        frames_writer = (
+            open_writer(frames, frame_columns(), batch_size=batch_size)
+            if frames
+            else None
+        )
+    except Exception as e:
+        results.close()
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    try:
+        # Both files are closed (footers written) even if the scan fails
+        with results, frames_writer or nullcontext():
+            for ticker in (t.upper() for t in tickers):
+                try:
+                    df_analyzed = add_indicators(fetch_data(ticker, period=period))
+                    result = analyze_market(df_analyzed, ticker)
+                except Exception as e:
+                    console.print(f"[yellow]Warning: {ticker}: {e}[/yellow]")
+                    continue
+
+                results.write(result_to_record(result))
+                if frames_writer:
+                    frames_writer.write_frame(frame_to_table(ticker, df_analyzed))
+                console.print(
+                    f"{ticker}: {result.signal.value} ({result.regime.value})"
+                )
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    console.print(f"[green]Wrote {results.rows_written} results to {output}[/green]")
+
+
+def print_universe(report: UniverseReport, benchmark: str) -> None:
+    """
+    Prints the breadth panel and the relative strength table.
+    """
+    summary_text = f"""
+    [bold]Tickers:[/bold] {len(report.tickers)}
+    [bold]Above EMA 200:[/bold] {report.pct_above_ema_200:.0%}
+    [bold]RSI < 30:[/bold] {report.pct_rsi_oversold:.0%}
+    """
+    console.print(Panel(summary_text, title="Universe Breadth", expand=False))
+
+    # Average correlation with the rest of the universe (excluding itself)
+    n = len(report.tickers)
+    avg_corr = report.correlation.mask(np.eye(n, dtype=bool)).mean()
+
+    table = Table(title=f"Relative Strength vs {benchmark}")
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Relative Strength", style="magenta")
+    table.add_column("Avg Correlation", style="green")
+
+    ranked = report.relative_strength.sort_values(ascending=False)
+    for symbol, rs in zip(ranked.index, ranked, strict=True):
+        table.add_row(str(symbol), f"{rs:+.2%}", f"{avg_corr[symbol]:.2f}")
+
+    console.print(table)
+
+
+@app.command()
+def universe(
+    tickers: list[str],
+    benchmark: str = "SPY",
+    period: str = "1y",
+    refresh: float = 0.0,
+) -> None:
+    """
+    Cross-sectional report: relative strength, correlation and breadth.
+
+    With --refresh N the report is rebuilt every N seconds; the correlation
+    matrix is then updated with the new bars instead of being recomputed.
+    """
+    benchmark = benchmark.upper()
+    symbols = list(dict.fromkeys([t.upper() for t in [*tickers, benchmark]]))
+    correlation = RollingCorrelation()
+
+    try:
+        while True:
+            try:
+                with console.status(
+                    f"[bold green]Fetching {len(symbols)} tickers...[/bold green]"
+                ):
+                    frames = fetch_many(symbols, period=period)
+                for ticker in symbols:
+                    if ticker not in frames:
+                        console.print(f"[yellow]Warning: No data for {ticker}[/yellow]")
+
+                print_universe(
+                    analyze_universe(frames, benchmark, correlation=correlation),
+                    benchmark,
+                )
+            except Exception as e:
+                if refresh <= 0:
+                    console.print(f"[bold red]Error:[/bold red] {e}")
+                    return
+                # A failed refresh keeps the correlation state for the next one
+                console.print(f"[yellow]Warning: {e}[/yellow]")
+
+            if refresh <= 0:
+                break
+            time.sleep(refresh)
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped.[/yellow]")
+
+
+@app.command(name="ingest")
+def ingest_file(
+    path: str,
+    interval: str = "1min",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    output: str | None = None,
+) -> None:
+    """
+    Aggregate a large tick or bar CSV into OHLCV bars and analyze them.
+    """
+    console.print(f"[bold blue]Ingesting {path}...[/bold blue]")
+    try:
+        with console.status("[bold green]Streaming file...[/bold green]"):
+            df, stats = ingest(path, interval=interval, chunksize=chunksize)
+
+        table = Table(title="Ingest Statistics")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="magenta")
+
+        table.add_row("Rows", f"{stats.rows:,}")
+        table.add_row("Bars", f"{stats.bars:,}")
+        table.add_row("Time", f"{stats.seconds:.2f}s")
+        table.add_row("Throughput", f"{stats.rows_per_sec:,.0f} rows/s")
+        table.add_row("Peak RSS", f"{stats.peak_rss_mb:.1f} MB")
+
+        console.print(table)
+
+        if output:
+            df.to_csv(output)
+            console.print(f"[green]Wrote {len(df):,} bars to {output}[/green]")
+
+        result = analyze_market(add_indicators(df), Path(path).stem)
+        console.print(
+            f"[bold]Regime:[/bold] {result.regime.value}  "
+            f"[bold]Signal:[/bold] {result.signal.value} "
+            f"({result.confidence:.0%})"
+        )
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+
+
+@app.command()
+def watch(
+    tickers: list[str],
+    interval: str = "1m",
+    poll: float = 60.0,
+    cooldown: float = 300.0,
+    sink: list[str] | None = None,
+) -> None:
+    """
+    Monitor tickers and alert when their signal or regime changes.
+
+    Each --sink is either a webhook URL (http/https) or a JSONL file path.
+    The download period is chosen from the interval so that EMA 200 has
+    enough history.
+    """
+    try:
+        period = lookback_period(interval)
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    sinks: list[AlertSink] = [StdoutSink()]
+    for target in sink or []:
+        if target.startswith(("http://", "https://")):
+            sinks.append(WebhookSink(target))
+        else:
+            sinks.append(JsonlSink(target))
+
+    engine = AlertEngine(sinks, cooldown=cooldown)
+    symbols = [t.upper() for t in tickers]
+    console.print(
+        f"[bold blue]Watching {len(symbols)} tickers every {poll:.0f}s...[/bold blue]"
+    )
+
+    warned: set[str] = set()
+    try:
+        while True:
+            try:
+                frames = fetch_many(symbols, period, interval)
+            except ConnectionError as e:
+                console.print(f"[yellow]Warning: {e}[/yellow]")
+                frames = {}
+
+            for ticker, df in frames.items():
+                if len(df) < MIN_HISTORY_BARS and ticker not in warned:
+                    warned.add(ticker)
+                    console.print(
+                        f"[yellow]Warning: {ticker} has only {len(df)} bars at "
+                        f"{interval}; EMA 200 needs {MIN_HISTORY_BARS}, so the "
+                        "regime will stay Sideways.[/yellow]"
+                    )
+                engine.push(ticker, df)
+
+            engine.run_cycle()
+            time.sleep(poll)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching.[/yellow]")
+
+
 @app.command()
 def interactive() -> None:
     """
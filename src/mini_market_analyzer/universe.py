@@ -0,0 +1,302 @@
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from mini_market_analyzer.strategy import RSI_OVERSOLD
+
+DEFAULT_BLOCK_SIZE = 512
+DEFAULT_WINDOW = 60
+DEFAULT_LOOKBACK = 63  # About one quarter of trading days
+MIN_OBSERVATIONS = 2
+
+
+@dataclass
+class UniverseReport:
+    tickers: list[str]
+    correlation: pd.DataFrame
+    relative_strength: pd.Series
+    breadth: pd.DataFrame
+    pct_above_ema_200: float
+    pct_rsi_oversold: float
+
+
+def _blocks(n: int, block_size: int) -> range:
+    return range(0, n, block_size)
+
+
+def build_price_matrix(
+    frames: Mapping[str, pd.DataFrame], column: str = "close"
+) -> pd.DataFrame:
+    """
+    Aligns per-ticker frames into a (time x tickers) price matrix.
+
+    Gaps (holidays, halts) are forward-filled; values before a ticker's
+    first bar stay NaN.
+    """
+    if not frames:
+        raise ValueError("No tickers provided.")
+
+    prices = pd.concat({t: df[column] for t, df in frames.items()}, axis=1)
+    return prices.sort_index().ffill()
+
+
+def _returns(prices: np.ndarray) -> np.ndarray:
+    """Simple returns with missing values treated as no change."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = prices[1:] / prices[:-1] - 1.0
+    cleaned: np.ndarray = np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+    return cleaned
+
+
+class RollingCorrelation:
+    """
+    Rolling correlation matrix of returns that is updated bar by bar.
+
+    Keeps running sums and a cross-product matrix over the last `window`
+    returns. Each new bar is a rank-1 update (add the new return row, remove
+    the oldest) instead of a full recomputation. Both the updates and the
+    final normalization are done in blocks of `block_size` tickers so
+    temporaries stay at `block_size x N` rather than `window x N x N`.
+    The sums are rebuilt from the window every `window` updates to stop
+    floating-point drift.
+    """
+
+    def __init__(
+        self, window: int = DEFAULT_WINDOW, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> None:
+        if window < MIN_OBSERVATIONS:
+            raise ValueError("window must be at least 2.")
+        self.window = window
+        self.block_size = block_size
+
+        self.tickers: list[str] = []
+        self._buffer = np.empty((0, 0))
+        self._count = 0
+        self._head = 0
+        self._sums = np.empty(0)
+        self._cross = np.empty((0, 0))
+        self._last_prices = np.empty(0)
+        self._updates = 0
+        self.last_timestamp: Hashable | None = None
+
+    def fit(self, prices: pd.DataFrame) -> "RollingCorrelation":
+        """Initializes the state from the tail of a price matrix."""
+        self.tickers = [str(c) for c in prices.columns]
+        values = prices.to_numpy(dtype=float)
+        returns = _returns(values[-(self.window + 1) :])
+
+        n = values.shape[1]
+        self._buffer = np.zeros((self.window, n))
+        self._count = len(returns)
+        self._buffer[: self._count] = returns
+        self._head = self._count % self.window
+        self._last_prices = values[-1].copy()
+        self.last_timestamp = prices.index[-1]
+        self._rebuild()
+        return self
+
+    def extend(self, prices: pd.DataFrame) -> "RollingCorrelation":
+        """
+        Brings the state up to date with a price matrix.
+
+        Only rows after `last_timestamp` are applied with `update`. It falls
+        back to `fit` if nothing was fitted yet, the ticker set changed, or the
+        bar at `last_timestamp` was revised since (e.g. the current session's
+        bar, or a forward-filled gap that has since been filled in).
+        """
+        if (
+            self.last_timestamp is None
+            or [str(c) for c in prices.columns] != self.tickers
+            or self.last_timestamp not in prices.index
+        ):
+            return self.fit(prices)
+
+        revised = prices.loc[prices.index == self.last_timestamp].to_numpy(dtype=float)
+        if not np.array_equal(revised[0], self._last_prices, equal_nan=True):
+            return self.fit(prices)
+
+        for timestamp, row in prices.loc[prices.index > self.last_timestamp].iterrows():
+            self.update(row)
+            self.last_timestamp = timestamp
+        return self
+
+    def update(self, prices: pd.Series | np.ndarray) -> None:
+        """Adds one new bar of prices, ordered like `tickers`."""
+        values = np.asarray(
+            prices.reindex(self.tickers) if isinstance(prices, pd.Series) else prices,
+            dtype=float,
+        )
+        new = _returns(np.vstack([self._last_prices, values]))[0]
+        # Keep the previous price for tickers that did not print this bar
+        self._last_prices = np.where(np.isnan(values), self._last_prices, values)
+
+        old = self._buffer[self._head].copy()
+        if self._count < self.window:
+            old[:] = 0.0
+            self._count += 1
+        self._buffer[self._head] = new
+        self._head = (self._head + 1) % self.window
+
+        self._updates += 1
+        if self._updates >= self.window:
+            self._rebuild()
+            return
+
+        self._sums += new - old
+        for start in _blocks(len(new), self.block_size):
+            end = start + self.block_size
+            self._cross[start:end] += (
+                new[start:end, None] * new[None, :] - old[start:end, None] * old
+            )
+
+    def _rebuild(self) -> None:
+        returns = self._buffer[: self._count]
+        n = returns.shape[1]
+        self._sums = returns.sum(axis=0)
+        self._cross = np.empty((n, n))
+        for start in _blocks(n, self.block_size):
+            end = start + self.block_size
+            self._cross[start:end] = returns[:, start:end].T @ returns
+        self._updates = 0
+
+    @property
+    def matrix(self) -> pd.DataFrame:
+        """The current correlation matrix (NaN for constant series)."""
+        count = self._count
+        n = len(self.tickers)
+        corr = np.full((n, n), np.nan)
+        if count < MIN_OBSERVATIONS:
+            return pd.DataFrame(corr, index=self.tickers, columns=self.tickers)
+
+        means = self._sums / count
+        variances = np.diag(self._cross) / count - means**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_std = np.where(variances > 0, 1.0 / np.sqrt(variances), np.nan)
+            for start in _blocks(n, self.block_size):
+                end = start + self.block_size
+                cov = self._cross[start:end] / count - means[start:end, None] * means
+                corr[start:end] = cov * inv_std[start:end, None] * inv_std
+        np.clip(corr, -1.0, 1.0, out=corr)
+        return pd.DataFrame(corr, index=self.tickers, columns=self.tickers)
+
+
+def relative_strength(
+    prices: pd.DataFrame, benchmark: str, lookback: int = DEFAULT_LOOKBACK
+) -> pd.Series:
+    """
+    Performance of each ticker relative to a benchmark over `lookback` bars.
+
+    A value of 0.05 means the ticker beat the benchmark by 5% over the period.
+    """
+    if benchmark not in prices.columns:
+        raise ValueError(f"Benchmark '{benchmark}' is not in the universe.")
+
+    window = prices.iloc[-(lookback + 1) :].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = window[-1] / window[0]
+    bench = growth[prices.columns.get_loc(benchmark)]
+    return pd.Series(growth / bench - 1.0, index=prices.columns, name="rs")
+
+
+def _ema(block: pd.DataFrame, length: int) -> pd.DataFrame:
+    """
+    EMA per column as pandas-ta computes `EMA_<length>`: seeded with the SMA
+    of the first `length` values, then `ewm(adjust=False)`.
+
+    The seed is taken per column from its first valid price, so tickers that
+    start later in the matrix match their own `add_indicators` output.
+    """
+    seen = block.notna().cumsum()
+    seed = block.rolling(length).mean()
+    seeded = block.where(seen > length).mask(seen == length, seed)
+    return seeded.ewm(span=length, adjust=False).mean()
+
+
+def _rsi(block: pd.DataFrame, length: int) -> pd.DataFrame:
+    """RSI per column as pandas-ta computes `RSI_<length>` (RMA smoothing)."""
+    delta = block.diff()
+    alpha = 1.0 / length
+    gain = delta.clip(lower=0).ewm(alpha=alpha, adjust=False).mean()
+    loss = delta.clip(upper=0).abs().ewm(alpha=alpha, adjust=False).mean()
+    return 100.0 * gain / (gain + loss)
+
+
+def breadth(prices: pd.DataFrame, block_size: int = DEFAULT_BLOCK_SIZE) -> pd.DataFrame:
+    """
+    Percent of the universe above its `EMA_200` and with `RSI_14` oversold,
+    for every bar.
+
+    The indicators follow the pandas-ta definitions used by `add_indicators`,
+    so breadth agrees with `analyze_market` on the same data. They are
+    computed block by block over the ticker columns, so only `block_size`
+    indicator columns are held at once. Tickers without enough history for
+    an indicator are left out of that bar's denominator.
+    """
+    n_rows = len(prices)
+    above = np.zeros(n_rows)
+    above_valid = np.zeros(n_rows)
+    oversold = np.zeros(n_rows)
+    oversold_valid = np.zeros(n_rows)
+
+    for start in _blocks(prices.shape[1], block_size):
+        block = prices.iloc[:, start : start + block_size].astype(float)
+        close = block.to_numpy()
+
+        ema = _ema(block, 200).to_numpy()
+        valid = ~np.isnan(ema) & ~np.isnan(close)
+        above += ((close > ema) & valid).sum(axis=1)
+        above_valid += valid.sum(axis=1)
+
+        rsi = _rsi(block, 14).to_numpy()
+        valid = ~np.isnan(rsi)
+        oversold += ((rsi < RSI_OVERSOLD) & valid).sum(axis=1)
+        oversold_valid += valid.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame(
+            {
+                "pct_above_ema_200": above / above_valid,
+                "pct_rsi_oversold": oversold / oversold_valid,
+            },
+            index=prices.index,
+        )
+
+
+def analyze_universe(
+    frames: Mapping[str, pd.DataFrame],
+    benchmark: str = "SPY",
+    lookback: int = DEFAULT_LOOKBACK,
+    correlation: RollingCorrelation | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> UniverseReport:
+    """
+    Computes cross-sectional views over a universe of OHLCV frames.
+
+    Args:
+        frames: Ticker -> DataFrame with a `close` column (e.g., `fetch_data`).
+        benchmark: Ticker used for relative strength (must be in `frames`).
+        lookback: Number of bars for relative strength.
+        correlation: State to reuse between calls. When given, only bars
+            newer than its last update are applied instead of refitting.
+        block_size: Number of tickers processed per NumPy block.
+
+    Returns:
+        UniverseReport: Correlation matrix, relative strength and breadth.
+    """
+    prices = build_price_matrix(frames)
+    if correlation is None:
+        correlation = RollingCorrelation(block_size=block_size)
+    correlation.extend(prices)
+    history = breadth(prices, block_size)
+    latest = history.iloc[-1]
+
+    return UniverseReport(
+        tickers=[str(c) for c in prices.columns],
+        correlation=correlation.matrix,
+        relative_strength=relative_strength(prices, benchmark, lookback),
+        breadth=history,
+        pct_above_ema_200=float(latest["pct_above_ema_200"]),
+        pct_rsi_oversold=float(latest["pct_rsi_oversold"]),
+    )
@@ -0,0 +1,182 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from mini_market_analyzer.alerts import AlertEngine, AlertEvent, JsonlSink
+
+
+class ListSink:
+    def __init__(self) -> None:
+        self.events: list[AlertEvent] = []
+
+    def emit(self, event: AlertEvent) -> None:
+        self.events.append(event)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_bar(day: int, close: float, rsi: float) -> pd.DataFrame:
+    # Bullish EMAs; the signal is driven by RSI and MACD
+    return pd.DataFrame(
+        {
+            "close": [close],
+            "EMA_50": [140.0],
+            "EMA_200": [130.0],
+            "RSI_14": [rsi],
+            "MACD_12_26_9": [0.0],
+            "MACDs_12_26_9": [0.5],
+        },
+        index=[pd.Timestamp("2024-01-01") + pd.Timedelta(days=day)],
+    )
+
+
+def make_engine(sink: ListSink, clock: FakeClock, cooldown: float = 0.0) -> AlertEngine:
+    return AlertEngine([sink], cooldown=cooldown, prepare=lambda df: df, clock=clock)
+
+
+def test_first_evaluation_sets_baseline_only() -> None:
+    sink = ListSink()
+    engine = make_engine(sink, FakeClock())
+
+    engine.push("AAPL", make_bar(0, 150.0, 50.0))
+
+    assert engine.run_cycle() == []
+    assert sink.events == []
+
+
+def test_signal_and_regime_transitions() -> None:
+    sink = ListSink()
+    engine = make_engine(sink, FakeClock())
+
+    engine.push("AAPL", make_bar(0, 150.0, 50.0))  # Bullish, HOLD
+    engine.run_cycle()
+    engine.push("AAPL", make_bar(1, 150.0, 25.0))  # Bullish, BUY
+    events = engine.run_cycle()
+
+    assert [(e.kind, e.previous, e.current) for e in events] == [
+        ("signal", "HOLD", "BUY")
+    ]
+
+    engine.push("AAPL", make_bar(2, 135.0, 50.0))  # Sideways, HOLD
+    events = engine.run_cycle()
+
+    assert [(e.kind, e.previous, e.current) for e in events] == [
+        ("regime", "Bullish", "Sideways"),
+        ("signal", "BUY", "HOLD"),
+    ]
+    assert sink.events[-2:] == events
+
+
+def test_only_updated_tickers_are_evaluated() -> None:
+    evaluated: list[float] = []
+
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        evaluated.append(df["close"].iloc[-1])
+        return df
+
+    engine = AlertEngine([], prepare=prepare)
+    engine.push("AAPL", make_bar(0, 150.0, 50.0))
+    engine.push("MSFT", make_bar(0, 151.0, 50.0))
+    engine.run_cycle()
+
+    # Re-sending an identical bar is not a change
+    assert not engine.push("AAPL", make_bar(0, 150.0, 50.0))
+    assert engine.push("MSFT", make_bar(1, 152.0, 50.0))
+    assert engine.pending == {"MSFT"}
+
+    engine.run_cycle()
+    assert evaluated == [150.0, 151.0, 152.0]
+
+
+def test_cooldown_and_dedupe() -> None:
+    sink = ListSink()
+    clock = FakeClock()
+    engine = make_engine(sink, clock, cooldown=60.0)
+
+    engine.push("AAPL", make_bar(0, 150.0, 50.0))
+    engine.run_cycle()
+    engine.push("AAPL", make_bar(1, 150.0, 25.0))
+    assert len(engine.run_cycle()) == 1  # HOLD -> BUY
+
+    # Flips back inside the cooldown window: suppressed
+    clock.now = 30.0
+    engine.push("AAPL", make_bar(2, 150.0, 50.0))
+    assert engine.run_cycle() == []
+
+    # Back to BUY after the cooldown: already alerted, deduped
+    clock.now = 120.0
+    engine.push("AAPL", make_bar(3, 150.0, 25.0))
+    assert engine.run_cycle() == []
+
+    clock.now = 200.0
+    engine.push("AAPL", make_bar(4, 150.0, 50.0))
+    events = engine.run_cycle()
+    assert [(e.previous, e.current) for e in events] == [("BUY", "HOLD")]
+
+
+def test_jsonl_sink(tmp_path: Path) -> None:
+    path = tmp_path / "alerts.jsonl"
+    sink = JsonlSink(path)
+    event = AlertEvent("AAPL", "signal", "HOLD", "BUY", 150.0, 0.8, 1.0)
+
+    sink.emit(event)
+    sink.emit(event)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["current"] == "BUY"
+
+
+def test_suppressed_change_is_emitted_after_cooldown() -> None:
+    sink = ListSink()
+    clock = FakeClock()
+    engine = make_engine(sink, clock, cooldown=60.0)
+
+    engine.push("AAPL", make_bar(0, 150.0, 50.0))
+    engine.run_cycle()
+    engine.push("AAPL", make_bar(1, 150.0, 25.0))
+    engine.run_cycle()  # HOLD -> BUY
+
+    clock.now = 30.0
+    engine.push("AAPL", make_bar(2, 150.0, 50.0))
+    assert engine.run_cycle() == []
+
+    # No new bars, but the pending BUY -> HOLD goes out once the cooldown ends
+    clock.now = 45.0
+    assert engine.run_cycle() == []
+    clock.now = 90.0
+    events = engine.run_cycle()
+    assert [(e.previous, e.current) for e in events] == [("BUY", "HOLD")]
+    assert engine.run_cycle() == []
+
+
+def test_failures_are_isolated() -> None:
+    class BrokenSink:
+        def emit(self, event: AlertEvent) -> None:
+            raise OSError("disk full")
+
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        if df["close"].iloc[-1] < 0:
+            raise ValueError("bad bar")
+        return df
+
+    sink = ListSink()
+    engine = AlertEngine([BrokenSink(), sink], cooldown=0.0, prepare=prepare)
+
+    for ticker in ["AAPL", "MSFT"]:
+        engine.push(ticker, make_bar(0, 150.0, 50.0))
+    engine.run_cycle()
+
+    engine.push("AAPL", make_bar(1, -1.0, 50.0))
+    engine.push("MSFT", make_bar(1, 150.0, 25.0))
+    events = engine.run_cycle()
+
+    assert [(e.ticker, e.current) for e in events] == [("MSFT", "BUY")]
+    assert sink.events == events
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
-from mini_market_analyzer.data_loader import fetch_data
+from mini_market_analyzer.data_loader import fetch_data, fetch_many, lookback_period
 
 
 @pytest.fixture
@@ -49,3 +49,25 @@ def test_fetch_data_missing_columns(mock_yf_download: MagicMock) -> None:
 
     with pytest.raises(ValueError, match="Missing required columns"):
         fetch_data("AAPL")
+
+
+def test_fetch_many_splits_tickers(mock_yf_download: MagicMock) -> None:
+    columns = pd.MultiIndex.from_product(
+        [["AAPL", "MSFT"], ["Open", "High", "Low", "Close", "Volume"]]
+    )
+    mock_df = pd.DataFrame([[1.0] * 5 + [None] * 5], columns=columns)
+    mock_yf_download.return_value = mock_df
+
+    frames = fetch_many(["AAPL", "MSFT"])
+
+    # MSFT has no data and is left out
+    assert list(frames) == ["AAPL"]
+    assert list(frames["AAPL"].columns) == ["open", "high", "low", "close", "volume"]
+    mock_yf_download.assert_called_once()
+
+
+def test_lookback_period() -> None:
+    assert lookback_period("1d") == "2y"
+
+    with pytest.raises(ValueError, match="Unsupported interval"):
+        lookback_period("7m")
@@ -0,0 +1,168 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from mini_market_analyzer.export import (
+    frame_columns,
+    frame_to_table,
+    infer_format,
+    open_writer,
+    result_columns,
+    result_to_record,
+)
+from mini_market_analyzer.strategy import AnalysisResult, MarketRegime, Signal
+
+
+def make_result(ticker: str) -> AnalysisResult:
+    return AnalysisResult(
+        ticker=ticker,
+        current_price=150.0,
+        regime=MarketRegime.BULLISH,
+        signal=Signal.BUY,
+        rsi=25.0,
+        macd=1.0,
+        macd_signal=0.5,
+        ema_50=140.0,
+        ema_200=130.0,
+        confidence=0.8,
+    )
+
+
+def test_result_to_record() -> None:
+    record = result_to_record(make_result("AAPL"))
+
+    assert record["ticker"] == "AAPL"
+    assert record["signal"] == "BUY"
+    assert record["regime"] == "Bullish"
+    assert record["confidence"] == 0.8
+
+
+def test_infer_format() -> None:
+    assert infer_format("out.parquet") == "parquet"
+    assert infer_format("out.JSONL") == "jsonl"
+    assert infer_format("out.arrow") == "arrow"
+
+    with pytest.raises(ValueError, match="Cannot infer"):
+        infer_format("out.txt")
+
+
+def test_jsonl_writer_batches(tmp_path: Path) -> None:
+    path = tmp_path / "results.jsonl"
+
+    with open_writer(path, result_columns(), batch_size=2) as writer:
+        for ticker in ["A", "B", "C"]:
+            writer.write(result_to_record(make_result(ticker)))
+        # Two rows are flushed as soon as the batch fills up
+        assert len(path.read_text().splitlines()) == 2
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["ticker"] for line in lines] == ["A", "B", "C"]
+    assert writer.rows_written == 3
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_arrow_writers(tmp_path: Path, suffix: str) -> None:
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / f"results{suffix}"
+
+    with open_writer(path, result_columns(), batch_size=2) as writer:
+        for ticker in ["A", "B", "C"]:
+            writer.write(result_to_record(make_result(ticker)))
+
+    if suffix == ".parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 2
+        table = parquet.read()
+    else:
+        table = pa.ipc.open_file(path).read_all()
+
+    assert table.column("ticker").to_pylist() == ["A", "B", "C"]
+    assert table.column("signal").to_pylist() == ["BUY"] * 3
+
+
+FRAME_COLUMNS = {
+    "ticker": "string",
+    "timestamp": "timestamp",
+    "close": "float",
+    "EMA_200": "float",
+}
+
+
+def make_frame(**columns: list[float]) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=3, name="Date")
+    return pd.DataFrame({"close": [1.0, 2.0, 3.0], **columns}, index)
+
+
+def test_result_columns() -> None:
+    columns = result_columns()
+
+    assert list(columns) == list(result_to_record(make_result("A")))
+    assert columns["ticker"] == columns["signal"] == "string"
+    assert columns["rsi"] == "float"
+
+
+def test_frame_columns_cover_indicators() -> None:
+    columns = frame_columns()
+
+    assert columns["timestamp"] == "timestamp"
+    for name in ["close", "EMA_50", "EMA_200", "RSI_14", "MACD_12_26_9"]:
+        assert columns[name] == "float"
+
+
+def test_frame_export_keeps_full_schema(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "frames.parquet"
+
+    with open_writer(path, FRAME_COLUMNS) as writer:
+        # First ticker has no EMA 200 (short history), the next one does
+        writer.write_frame(frame_to_table("AAPL", make_frame()))
+        writer.write_frame(
+            frame_to_table("MSFT", make_frame(EMA_200=[float("nan")] * 3))
+        )
+        writer.write_frame(frame_to_table("NVDA", make_frame(EMA_200=[1.0, 2.0, 3.0])))
+
+    table = pq.read_table(path)
+    assert table.column_names == ["ticker", "timestamp", "close", "EMA_200"]
+    assert table.column("EMA_200").to_pylist() == [None] * 6 + [1.0, 2.0, 3.0]
+    assert str(table.schema.field("timestamp").type) == "timestamp[ns, tz=UTC]"
+
+
+def test_frames_are_batched_into_row_groups(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "frames.parquet"
+
+    with open_writer(path, FRAME_COLUMNS, batch_size=6) as writer:
+        for ticker in ["A", "B", "C", "D"]:
+            writer.write_frame(frame_to_table(ticker, make_frame()))
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 12
+    assert parquet.metadata.num_row_groups == 2
+
+
+def test_unknown_column_fails(tmp_path: Path) -> None:
+    with (
+        open_writer(tmp_path / "frames.jsonl", FRAME_COLUMNS) as writer,
+        pytest.raises(ValueError, match="not in the output schema"),
+    ):
+        writer.write_frame(frame_to_table("AAPL", make_frame(RSI_14=[1.0] * 3)))
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_empty_output_has_schema(tmp_path: Path, suffix: str) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / f"results{suffix}"
+
+    with open_writer(path, result_columns()):
+        pass
+
+    if suffix == ".parquet":
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(path).read_all()
+    assert table.num_rows == 0
+    assert table.column_names == list(result_columns())
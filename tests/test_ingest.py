@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mini_market_analyzer.ingest import IngestStats, ingest, iter_bars
+
+
+@pytest.fixture
+def tick_file(tmp_path: Path) -> Path:
+    rng = np.random.default_rng(0)
+    n = 1000
+    ticks = pd.DataFrame(
+        {
+            "Timestamp": pd.date_range("2024-01-02 09:30", periods=n, freq="7s"),
+            "Price": 100 + rng.standard_normal(n).cumsum(),
+            "Size": rng.integers(1, 100, n),
+        }
+    )
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+    return path
+
+
+def test_ingest_ticks_matches_resample(tick_file: Path) -> None:
+    raw = pd.read_csv(tick_file, parse_dates=["Timestamp"], index_col="Timestamp")
+    expected = raw["Price"].resample("1min").ohlc()
+    expected["volume"] = raw["Size"].resample("1min").sum()
+
+    # Small chunks force bars to straddle chunk boundaries
+    df, stats = ingest(tick_file, interval="1min", chunksize=37)
+
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert stats.rows == 1000
+    assert stats.bars == len(df) == len(expected)
+    np.testing.assert_allclose(df.to_numpy(float), expected.to_numpy(float))
+
+
+def test_ingest_bars_into_larger_interval(tmp_path: Path) -> None:
+    bars = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-02", periods=6, freq="1min"),
+            "open": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "high": [2.0, 9.0, 4.0, 5.0, 6.0, 7.0],
+            "low": [0.5, 1.0, 2.0, 3.0, 0.1, 5.0],
+            "close": [2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+            "volume": [10, 10, 10, 10, 10, 10],
+        }
+    )
+    path = tmp_path / "bars.csv"
+    bars.to_csv(path, index=False)
+
+    df, _ = ingest(path, interval="3min", chunksize=2)
+
+    assert df["open"].tolist() == [1.0, 4.0]
+    assert df["high"].tolist() == [9.0, 7.0]
+    assert df["low"].tolist() == [0.5, 0.1]
+    assert df["close"].tolist() == [4.0, 7.0]
+    assert df["volume"].tolist() == [30, 30]
+
+
+def test_iter_bars_streams_chunks(tick_file: Path) -> None:
+    stats = IngestStats()
+    parts = list(iter_bars(tick_file, interval="1min", chunksize=100, stats=stats))
+
+    assert len(parts) > 1
+    assert stats.rows_per_sec > 0
+    assert stats.peak_rss_mb > 0
+
+
+def test_ingest_missing_columns(tmp_path: Path) -> None:
+    path = tmp_path / "bad.csv"
+    path.write_text("timestamp,foo\n2024-01-02,1\n")
+
+    with pytest.raises(ValueError, match="price column"):
+        ingest(path)
+
+
+@pytest.mark.parametrize("chunksize", [2, 10])
+def test_ingest_rejects_out_of_order(tmp_path: Path, chunksize: int) -> None:
+    path = tmp_path / "unsorted.csv"
+    path.write_text(
+        "timestamp,price\n"
+        "2024-01-02 09:30:00,1\n"
+        "2024-01-02 09:30:30,2\n"
+        "2024-01-02 09:31:10,3\n"
+        "2024-01-02 09:30:50,4\n"
+    )
+
+    with pytest.raises(ValueError, match="chronological order"):
+        ingest(path, chunksize=chunksize)
+
+
+def test_ingest_header_only(tmp_path: Path) -> None:
+    path = tmp_path / "empty.csv"
+    path.write_text("timestamp,price,size\n")
+
+    with pytest.raises(ValueError, match="No data found"):
+        ingest(path)
+
+
+def test_ingest_offsets_across_dst(tmp_path: Path) -> None:
+    # US clocks go from 01:59 EST (-05:00) to 03:00 EDT (-04:00)
+    path = tmp_path / "dst.csv"
+    path.write_text(
+        "timestamp,price,size\n"
+        "2024-03-10 01:59:10-05:00,1,1\n"
+        "2024-03-10 01:59:50-05:00,2,1\n"
+        "2024-03-10 03:00:20-04:00,3,1\n"
+        "2024-03-10 03:01:05-04:00,4,1\n"
+    )
+
+    df, _ = ingest(path, interval="1min", chunksize=2)
+
+    assert df.index.tolist() == [
+        pd.Timestamp("2024-03-10 06:59"),
+        pd.Timestamp("2024-03-10 07:00"),
+        pd.Timestamp("2024-03-10 07:01"),
+    ]
+    assert df["close"].tolist() == [2.0, 3.0, 4.0]
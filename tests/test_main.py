@@ -0,0 +1,93 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from mini_market_analyzer.main import app
+
+runner = CliRunner()
+
+
+def fake_fetch(ticker: str, period: str = "1y") -> pd.DataFrame:
+    rng = np.random.default_rng(len(ticker))
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 300)))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": 1e6,
+        },
+        index=pd.date_range("2024-01-01", periods=300, freq="D"),
+    )
+
+
+def test_scan_documented_invocation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr("mini_market_analyzer.main.fetch_data", fake_fetch)
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        app,
+        [
+            "scan",
+            "AAPL",
+            "NVDA",
+            "TSLA",
+            "--output",
+            "results.parquet",
+            "--frames",
+            "frames.parquet",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Wrote 3 results to results.parquet" in result.output
+    results = pq.read_table(tmp_path / "results.parquet")
+    assert results.column("ticker").to_pylist() == ["AAPL", "NVDA", "TSLA"]
+    assert pq.read_table(tmp_path / "frames.parquet").num_rows == 900
+
+
+def test_universe_refresh_survives_failed_cycles(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    good = {t: fake_fetch(t) for t in ["AAPL", "SPY"]}
+    cycles: Iterator[Exception | dict[str, pd.DataFrame]] = iter(
+        [
+            ConnectionError("network down"),
+            {"AAPL": good["AAPL"]},  # Benchmark missing this cycle
+            good,
+        ]
+    )
+    reports: list[object] = []
+
+    def fetch_many(symbols: list[str], period: str) -> dict[str, pd.DataFrame]:
+        cycle = next(cycles)
+        if isinstance(cycle, Exception):
+            raise cycle
+        return cycle
+
+    def sleep(seconds: float) -> None:
+        if len(reports) == 1:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("mini_market_analyzer.main.fetch_many", fetch_many)
+    monkeypatch.setattr(
+        "mini_market_analyzer.main.print_universe",
+        lambda report, benchmark: reports.append(report),
+    )
+    monkeypatch.setattr("mini_market_analyzer.main.time.sleep", sleep)
+
+    result = runner.invoke(app, ["universe", "AAPL", "--refresh", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "network down" in result.output
+    assert "Benchmark 'SPY' is not in the universe" in result.output
+    assert "Stopped." in result.output
+    assert len(reports) == 1
@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mini_market_analyzer.indicators import add_indicators
+from mini_market_analyzer.strategy import RSI_OVERSOLD
+from mini_market_analyzer.universe import (
+    RollingCorrelation,
+    analyze_universe,
+    breadth,
+    build_price_matrix,
+    relative_strength,
+)
+
+
+def make_prices(n_rows: int = 300, n_tickers: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    returns = rng.normal(0.0005, 0.01, (n_rows, n_tickers))
+    prices = 100 * np.cumprod(1 + returns, axis=0)
+    index = pd.date_range("2023-01-02", periods=n_rows, freq="B")
+    return pd.DataFrame(
+        prices, index=index, columns=[f"T{i}" for i in range(n_tickers)]
+    )
+
+
+def test_build_price_matrix_aligns_and_fills() -> None:
+    a = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=[1, 2, 3])
+    b = pd.DataFrame({"close": [10.0, 30.0]}, index=[1, 3])
+
+    prices = build_price_matrix({"A": a, "B": b})
+
+    assert prices["B"].tolist() == [10.0, 10.0, 30.0]
+
+
+def test_rolling_correlation_matches_pandas() -> None:
+    prices = make_prices()
+    expected = prices.pct_change().iloc[-20:].corr()
+
+    corr = RollingCorrelation(window=20, block_size=3).fit(prices)
+
+    np.testing.assert_allclose(corr.matrix.to_numpy(), expected.to_numpy())
+
+
+def test_rolling_correlation_incremental_update() -> None:
+    prices = make_prices()
+    corr = RollingCorrelation(window=20, block_size=3).fit(prices.iloc[:200])
+
+    for _, row in prices.iloc[200:].iterrows():
+        corr.update(row)
+
+    expected = prices.pct_change().iloc[-20:].corr()
+    np.testing.assert_allclose(corr.matrix.to_numpy(), expected.to_numpy())
+
+
+def test_rolling_correlation_extend_applies_only_new_bars() -> None:
+    prices = make_prices()
+    corr = RollingCorrelation(window=20).fit(prices.iloc[:250])
+
+    corr.extend(prices)
+
+    assert corr.last_timestamp == prices.index[-1]
+    expected = prices.pct_change().iloc[-20:].corr()
+    np.testing.assert_allclose(corr.matrix.to_numpy(), expected.to_numpy())
+
+    # A different ticker set is refitted from scratch
+    corr.extend(prices.iloc[:, :3])
+    assert corr.tickers == ["T0", "T1", "T2"]
+
+
+def test_rolling_correlation_extend_refits_revised_last_bar() -> None:
+    prices = make_prices().iloc[:253]
+    provisional = prices.iloc[:250].copy()
+    provisional.iloc[-1] *= 1.05  # Intraday value of the session's bar
+    corr = RollingCorrelation(window=20).fit(provisional)
+
+    corr.extend(prices)
+
+    expected = RollingCorrelation(window=20).fit(prices).matrix
+    np.testing.assert_allclose(corr.matrix.to_numpy(), expected.to_numpy())
+
+
+def test_relative_strength() -> None:
+    prices = pd.DataFrame({"SPY": [100.0, 110.0], "AAA": [50.0, 66.0]})
+
+    rs = relative_strength(prices, "SPY", lookback=1)
+
+    assert rs["SPY"] == pytest.approx(0.0)
+    assert rs["AAA"] == pytest.approx(1.32 / 1.1 - 1)
+
+    with pytest.raises(ValueError, match="Benchmark"):
+        relative_strength(prices, "QQQ")
+
+
+def test_breadth() -> None:
+    index = pd.RangeIndex(300)
+    up = pd.Series(np.linspace(100, 200, 300), index=index)
+    prices = pd.DataFrame({"UP": up, "DOWN": up[::-1].to_numpy()}, index=index)
+
+    result = breadth(prices, block_size=1)
+
+    assert result["pct_above_ema_200"].iloc[:199].isna().all()
+    assert result["pct_above_ema_200"].iloc[-1] == pytest.approx(0.5)
+    assert result["pct_rsi_oversold"].iloc[-1] == pytest.approx(0.5)
+
+
+def test_analyze_universe() -> None:
+    prices = make_prices()
+    frames = {t: prices[[t]].rename(columns={t: "close"}) for t in prices.columns}
+
+    report = analyze_universe(
+        frames, benchmark="T0", correlation=RollingCorrelation(window=30)
+    )
+
+    assert report.tickers == list(prices.columns)
+    assert report.correlation.shape == (7, 7)
+    assert report.relative_strength["T0"] == pytest.approx(0.0)
+    assert 0.0 <= report.pct_above_ema_200 <= 1.0
+
+
+def test_breadth_matches_add_indicators() -> None:
+    prices = make_prices(n_rows=260, n_tickers=5)
+    # Push one ticker into oversold territory
+    prices.iloc[-15:, 0] *= np.linspace(1.0, 0.7, 15)
+    analyzed = {}
+    for ticker in prices.columns:
+        close = prices[ticker]
+        ohlcv = pd.DataFrame(
+            {"open": close, "high": close, "low": close, "close": close, "volume": 1}
+        )
+        analyzed[ticker] = add_indicators(ohlcv).iloc[-1]
+
+    above = [row["close"] > row["EMA_200"] for row in analyzed.values()]
+    oversold = [row["RSI_14"] < RSI_OVERSOLD for row in analyzed.values()]
+
+    latest = breadth(prices).iloc[-1]
+
+    assert latest["pct_above_ema_200"] == pytest.approx(np.mean(above))
+    assert latest["pct_rsi_oversold"] == pytest.approx(np.mean(oversold))